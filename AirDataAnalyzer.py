@@ -2,7 +2,27 @@
 
 from enum import Enum
 
+import array
 import csv
+import functools
+import itertools
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+    pd = None
+except ImportError:
+    pa = None
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
 
 
 class EmptyDatasetError(Exception):
@@ -21,6 +41,207 @@ class NoMatchingItems(Exception):
 
 filename = './air_data.csv'
 
+chunk_rows = 1_000_000
+
+cache_format = 1
+
+numba_min_rows = 10_000_000
+numba_rows_per_chunk = 1_000_000
+
+_row_label = "{:<7}".format
+_column_label = "{:>8}".format
+_number_cell = "{:>8.2f}".format
+_number_cell_format = "%8.2f"
+_missing_cell = f"{'N/A':>8}"
+
+
+def _cache_path(path: str):
+    """ Return the path of the .npz cache kept for the data file at
+    path.
+    """
+    return os.path.splitext(path)[0] + '.npz'
+
+
+def _has_data_rows(path: str):
+    """ Return True if the file at path has a non-blank line after its
+    header row.
+    """
+    with open(path, 'r', newline='') as air_file:
+        next(air_file, None)
+        return any(line.strip() for line in air_file)
+
+
+def _code_dtype(n_labels: int):
+    """ Return the smallest signed integer type that holds n_labels
+    label codes.
+    """
+    if n_labels <= np.iinfo(np.int16).max:
+        return np.int16
+    return np.int32
+
+
+def _encode_labels(chunk_codes, chunk_names, label_codes: dict):
+    """ Translate codes into one chunk's own list of chunk_names into
+    codes of the running label_codes mapping, adding names it has not
+    seen yet in order of first appearance.
+
+    Returns:
+        numpy array: the chunk's labels as codes into label_codes
+    """
+    remap = np.array([label_codes.setdefault(str(name), len(label_codes))
+                      for name in chunk_names], dtype=np.int32)
+    return remap[chunk_codes].astype(_code_dtype(len(label_codes)))
+
+
+def _read_columns(path: str):
+    """ Read the zip code, time of day and concentration columns of
+    the air data file at path a chunk at a time. Each chunk's labels
+    are encoded as integer codes as soon as it is read, so only codes
+    and float64 concentrations are kept. Use pyarrow or pandas when
+    installed, otherwise fall back to the csv module.
+
+    Returns:
+        tuple: zip code codes, time of day codes, float64
+        concentrations, zip code names, time of day names
+    """
+    zip_codes, time_codes = dict(), dict()
+    zips, times, concs = [], [], []
+    if pa is not None:
+        try:
+            reader = pa_csv.open_csv(
+                path,
+                read_options=pa_csv.ReadOptions(
+                    skip_rows=1, autogenerate_column_names=True),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=['f1', 'f4', 'f5'],
+                    column_types={'f1': pa.string(), 'f4': pa.string(),
+                                  'f5': pa.float64()}))
+        except pa.ArrowInvalid:
+            if _has_data_rows(path):
+                raise
+            reader = []
+        for batch in reader:
+            for column, label_codes, codes in (('f1', zip_codes, zips),
+                                               ('f4', time_codes, times)):
+                encoded = pa_compute.dictionary_encode(batch.column(column))
+                codes.append(_encode_labels(
+                    encoded.indices.to_numpy(),
+                    encoded.dictionary.to_pylist(), label_codes))
+            concs.append(batch.column('f5').to_numpy())
+    elif pd is not None:
+        try:
+            reader = pd.read_csv(path, header=None, skiprows=1,
+                                 usecols=[1, 4, 5],
+                                 dtype={1: str, 4: str, 5: np.float64},
+                                 na_filter=False, chunksize=chunk_rows)
+        except pd.errors.EmptyDataError:
+            reader = None
+        if reader is not None:
+            with reader:
+                for frame in reader:
+                    for column, label_codes, codes in (
+                            (1, zip_codes, zips), (4, time_codes, times)):
+                        chunk_codes, chunk_names = pd.factorize(frame[column])
+                        codes.append(_encode_labels(chunk_codes, chunk_names,
+                                                    label_codes))
+                    concs.append(frame[5].to_numpy())
+    else:
+        with open(path, 'r', newline='') as air_file:
+            csvreader = csv.reader(air_file)
+            next(csvreader)
+            while True:
+                chunk_zips, chunk_times = array.array('i'), array.array('i')
+                chunk_concs = array.array('d')
+                for row in itertools.islice(csvreader, chunk_rows):
+                    chunk_zips.append(
+                        zip_codes.setdefault(row[1], len(zip_codes)))
+                    chunk_times.append(
+                        time_codes.setdefault(row[4], len(time_codes)))
+                    chunk_concs.append(float(row[5]))
+                if not chunk_concs:
+                    break
+                zips.append(np.frombuffer(chunk_zips, dtype=np.intc).astype(
+                    _code_dtype(len(zip_codes))))
+                times.append(np.frombuffer(chunk_times, dtype=np.intc).astype(
+                    _code_dtype(len(time_codes))))
+                concs.append(np.frombuffer(chunk_concs, dtype=np.float64))
+    if not concs:
+        return (np.empty(0, dtype=np.int16), np.empty(0, dtype=np.int16),
+                np.empty(0, dtype=np.float64), [], [])
+    return (np.concatenate(zips), np.concatenate(times),
+            np.concatenate(concs), list(zip_codes), list(time_codes))
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernel():
+    """ Import Numba and compile the chunked aggregation kernel on
+    first use, so starting the program does not pay for Numba.
+
+    Returns:
+        tuple: kernel and numba.get_num_threads, or None when Numba is
+        not installed
+    """
+    try:
+        from numba import get_num_threads, njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def aggregate_chunks(zips, times, conc, n_times, n_cells, n_chunks):
+        """ Split the rows into n_chunks and aggregate each chunk into
+        its own row of min, sum, count and max arrays in parallel.
+        """
+        mins = np.full((n_chunks, n_cells), np.inf)
+        sums = np.zeros((n_chunks, n_cells))
+        counts = np.zeros((n_chunks, n_cells), dtype=np.int64)
+        maxs = np.full((n_chunks, n_cells), -np.inf)
+        step = (conc.size + n_chunks - 1) // n_chunks
+        for chunk in prange(n_chunks):
+            for i in range(chunk * step, min(conc.size, (chunk + 1) * step)):
+                cell = zips[i] * n_times + times[i]
+                value = conc[i]
+                sums[chunk, cell] += value
+                counts[chunk, cell] += 1
+                if value < mins[chunk, cell]:
+                    mins[chunk, cell] = value
+                if value > maxs[chunk, cell]:
+                    maxs[chunk, cell] = value
+        return mins, sums, counts, maxs
+
+    return aggregate_chunks, get_num_threads
+
+
+def _aggregate(zips, times, conc, n_zips: int, n_times: int):
+    """ Compute the min, sum, count and max of conc for every
+    (zip code, time of day) cell in one pass. Use the Numba kernel when
+    Numba is installed and there are at least numba_min_rows rows, so
+    its compile or cache-load cost pays off; otherwise use NumPy grouped
+    reductions. Each kernel chunk covers at least numba_rows_per_chunk
+    rows, which bounds the per-chunk scratch arrays.
+
+    Returns:
+        tuple: min, sum, count, max arrays indexed by
+        zip code * n_times + time of day
+    """
+    n_cells = n_zips * n_times
+    kernel = _numba_kernel() if conc.size >= numba_min_rows else None
+    if kernel is not None:
+        aggregate_chunks, get_num_threads = kernel
+        n_chunks = max(1, min(get_num_threads(),
+                              conc.size // numba_rows_per_chunk))
+        mins, sums, counts, maxs = aggregate_chunks(
+            zips, times, conc, n_times, n_cells, n_chunks)
+        return (mins.min(axis=0), sums.sum(axis=0), counts.sum(axis=0),
+                maxs.max(axis=0))
+    cells = zips.astype(np.intp) * n_times + times
+    mins = np.full(n_cells, np.inf)
+    maxs = np.full(n_cells, -np.inf)
+    np.minimum.at(mins, cells, conc)
+    np.maximum.at(maxs, cells, conc)
+    return (mins, np.bincount(cells, weights=conc, minlength=n_cells),
+            np.bincount(cells, minlength=n_cells), maxs)
+
+
 menu_options = {
     1: "Print Average Particulate Concentration by Zip Code and Time",
     2: "Print Minimum Particulate Concentration by Zip Code and Time",
@@ -51,9 +272,24 @@ class DataSet:
         MAX = 2
 
     def __init__(self, header=""):
-        self._labels = {DataSet.Categories.ZIP_CODE: dict(),
-                        DataSet.Categories.TIME_OF_DAY: dict()}
-        self._data = None
+        self._active = {DataSet.Categories.ZIP_CODE: np.ones(0, dtype=bool),
+                        DataSet.Categories.TIME_OF_DAY: np.ones(0, dtype=bool)}
+        self._size = 0
+        self._zip = None
+        self._time = None
+        self._conc = None
+        self._label_names = {DataSet.Categories.ZIP_CODE: [],
+                             DataSet.Categories.TIME_OF_DAY: []}
+        self._label_codes = {DataSet.Categories.ZIP_CODE: dict(),
+                             DataSet.Categories.TIME_OF_DAY: dict()}
+        self._all_active = {category: True for category in DataSet.Categories}
+        self._generation = {category: 0 for category in DataSet.Categories}
+        self._active_cache = dict()
+        self._stats_cube = None
+        self._cell_mins = None
+        self._cell_sums = None
+        self._cell_counts = None
+        self._cell_maxs = None
         self.header = header
 
     @property
@@ -71,100 +307,234 @@ class DataSet:
         else:
             self._header = new_header
 
+    def _set_label_names(self, category: Categories, names: list):
+        """ Store the label names of category, indexed by code, and
+        the mapping from each name back to its code.
+        """
+        self._label_names[category] = names
+        self._label_codes[category] = {name: code for code, name
+                                       in enumerate(names)}
+
     def _initialize_labels(self):
         """ Raise EmptyDatasetError when no data set is loaded.
-        Populate self._labels dictionary with labels from self._data
-        and True value.
+        Mark every label in self._label_names active by setting its
+        code in the self._active boolean mask.
         """
-        if not self._data:
+        if not self._size:
             raise EmptyDatasetError
         for category in self.Categories:
-            self._labels[category] = \
-                {i[category.value]: True for i in self._data}
+            self._active[category] = \
+                np.ones(len(self._label_names[category]), dtype=bool)
+            self._all_active[category] = True
+            self._generation[category] += 1
+
+    def _active_index(self, category: Categories):
+        """ Return an index selecting the active labels of category
+        along one axis of the cell arrays: a full slice, which avoids a
+        copy, when every label is active, otherwise the boolean mask.
+        """
+        if self._all_active[category]:
+            return slice(None)
+        return self._active[category]
+
+    def _aggregate_cells(self):
+        """ Make a single pass over the loaded data and keep the min,
+        sum, count and max of every (zip code, time of day) cell as
+        zip code by time of day arrays. Stack the min, average and max
+        into _stats_cube, indexed by Stats value, with NaN for cells
+        without data.
+        """
+        if not self._size:
+            raise EmptyDatasetError
+        shape = (len(self._label_names[DataSet.Categories.ZIP_CODE]),
+                 len(self._label_names[DataSet.Categories.TIME_OF_DAY]))
+        mins, sums, counts, maxs = _aggregate(
+            self._zip, self._time, self._conc, *shape)
+        self._cell_mins = mins.reshape(shape)
+        self._cell_sums = sums.reshape(shape)
+        self._cell_counts = counts.reshape(shape)
+        self._cell_maxs = maxs.reshape(shape)
+        empty = self._cell_counts == 0
+        self._stats_cube = np.stack(
+            [np.where(empty, np.nan, self._cell_mins),
+             np.divide(self._cell_sums, self._cell_counts,
+                       out=np.full(shape, np.nan), where=~empty),
+             np.where(empty, np.nan, self._cell_maxs)], axis=-1)
+
+    def _read_cache(self, source: os.stat_result):
+        """ Load the columns and label names from the .npz cache next
+        to the Air data file. Return False when there is no cache, or it
+        was written by another cache_format or for a different version
+        of the file. Delete a cache that cannot be read.
+        """
+        path = _cache_path(filename)
+        try:
+            with np.load(path) as cache:
+                if int(cache['format']) != cache_format or \
+                        cache['source'].tolist() != [source.st_mtime_ns,
+                                                     source.st_size]:
+                    return False
+                zip_names = cache['zip_names'].tolist()
+                time_names = cache['time_names'].tolist()
+                zips, times, conc = cache['zip'], cache['time'], cache['conc']
+        except FileNotFoundError:
+            return False
+        except (OSError, EOFError, KeyError, ValueError,
+                zipfile.BadZipFile):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return False
+        self._set_label_names(DataSet.Categories.ZIP_CODE, zip_names)
+        self._set_label_names(DataSet.Categories.TIME_OF_DAY, time_names)
+        self._zip, self._time, self._conc = zips, times, conc
+        return True
+
+    def _write_cache(self, source: os.stat_result):
+        """ Save the columns and label names to the .npz cache next to
+        the Air data file, tagged with cache_format and the file's mtime
+        and size. Write to a temporary file first and move it into place,
+        so an interrupted write never leaves a partial cache. A cache
+        that cannot be written is skipped.
+        """
+        path = _cache_path(filename)
+        try:
+            handle, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(path) or '.',
+                prefix=os.path.basename(path), suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(handle, 'wb') as cache_file:
+                np.savez(
+                    cache_file,
+                    format=np.array(cache_format),
+                    source=np.array([source.st_mtime_ns, source.st_size]),
+                    zip_names=np.array(
+                        self._label_names[DataSet.Categories.ZIP_CODE],
+                        dtype=str),
+                    time_names=np.array(
+                        self._label_names[DataSet.Categories.TIME_OF_DAY],
+                        dtype=str),
+                    zip=self._zip, time=self._time, conc=self._conc)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
 
     def load_file(self):
-        """ Load the data from the Air data file into self._data
-        and return number of lines in data.
+        """ Load the data from the Air data file into the parallel
+        _zip, _time and _conc arrays and print number of lines in data.
+        Zip codes and times of day are stored as integer label codes.
+        Reuse the .npz cache of a previous load when the file is
+        unchanged, and only cache files that have rows.
         """
-        with open(filename, 'r', newline='') as air_file:
-            csvreader = csv.reader(air_file)
-            next(csvreader)
-            self._data = [(row[1], row[4], float(row[5])) for row in csvreader]
-            count = len(self._data)
+        source = os.stat(filename)
+        if not self._read_cache(source):
+            self._zip, self._time, self._conc, zip_names, time_names = \
+                _read_columns(filename)
+            self._set_label_names(DataSet.Categories.ZIP_CODE, zip_names)
+            self._set_label_names(DataSet.Categories.TIME_OF_DAY, time_names)
+            if len(self._conc):
+                self._write_cache(source)
+        count = len(self._conc)
+        self._size = count
         self._initialize_labels()
+        self._aggregate_cells()
         print(f"{count} lines loaded")
 
     def get_labels(self, category: Categories):
-        """ Return a list of all the keys in _labels[category]. """
-        if not self._data:
+        """ Return a list of all the labels in category. """
+        if not self._size:
             raise EmptyDatasetError
-        return [key for key in self._labels[category]]
+        return list(self._label_names[category])
 
     def get_active_labels(self, category: Categories):
-        """ Return a list of keys in _labels[category] that have
-        True as a value.
+        """ Return a tuple of labels in category whose code is set in
+        _active[category]. The tuple is cached until the labels of the
+        category change.
         """
-        if not self._data:
+        if not self._size:
             raise EmptyDatasetError
-        return [key for key, value in self._labels[category].items()
-                if value is True]
+        generation, active = self._active_cache.get(category, (None, None))
+        if generation != self._generation[category]:
+            generation = self._generation[category]
+            names = self._label_names[category]
+            if self._all_active[category]:
+                active = tuple(names)
+            else:
+                active = tuple(
+                    names[code] for code
+                    in np.flatnonzero(self._active[category]).tolist())
+            self._active_cache[category] = (generation, active)
+        return active
 
     def toggle_active_label(self, category: Categories, descriptor: str):
-        """ Raise KeyError if descriptor is not a key in the nested
-        dictionary. Change the value of the entry associated with
-        descriptor from True to False or from False to True.
+        """ Raise KeyError if descriptor is not a label in category.
+        Flip the active flag of descriptor's code from True to False or
+        from False to True.
         """
-        if not self._data:
+        if not self._size:
             raise EmptyDatasetError
-        if descriptor not in self._labels[category]:
+        if descriptor not in self._label_codes[category]:
             raise KeyError
         else:
-            self._labels[category][descriptor] = \
-                not self._labels[category][descriptor]
+            code = self._label_codes[category][descriptor]
+            self._active[category][code] = not self._active[category][code]
+            self._all_active[category] = bool(self._active[category].all())
+            self._generation[category] += 1
 
     def _cross_table_statistics(self, descriptor_one: str,
                                 descriptor_two: str):
-        """ Raise exceptions when there is no data or list is empty.
-        Create list using two parameters and loaded data.
-        Calculate the average of the list.
+        """ Raise EmptyDatasetError when no data is loaded, and
+        NoMatchingItems for an unknown label or a cell with a zero
+        count. Look up the statistics of the matching cell in
+        _stats_cube.
 
         Args:
             descriptor_one (str): zip code of air concentration
             descriptor_two (str): time of day of air concentration
         Returns:
-            tuple: min, average, max from the matching row
+            tuple: min, average, max of the matching cell
         """
-        if not self._data:
+        if not self._size:
             raise EmptyDatasetError
-        concentration_list = [item[2] for item in self._data if
-                              item[0] == descriptor_one and
-                              item[1] == descriptor_two]
-        if not concentration_list:
+        try:
+            cell = (self._label_codes[DataSet.Categories.ZIP_CODE][
+                        descriptor_one],
+                    self._label_codes[DataSet.Categories.TIME_OF_DAY][
+                        descriptor_two])
+        except KeyError:
+            raise NoMatchingItems
+        if not self._cell_counts[cell]:
             raise NoMatchingItems
         else:
-            average = sum(concentration_list) / len(concentration_list)
-            return min(concentration_list), average, max(concentration_list)
+            return tuple(self._stats_cube[cell].tolist())
 
     def display_cross_table(self, stat: Stats):
         """ Displays a cross table of different air concentration
-        statistics.
+        statistics. Format the active part of _stats_cube in one
+        np.char.mod call.
         """
-        if not self._data:
+        if not self._size:
             raise EmptyDatasetError
+        active_zips = self._active_index(DataSet.Categories.ZIP_CODE)
+        active_times = self._active_index(DataSet.Categories.TIME_OF_DAY)
+        values = self._stats_cube[active_zips][:, active_times, stat.value]
+        cells = np.char.mod(_number_cell_format, values)
+        cells[np.isnan(values)] = _missing_cell
         print()
-        print(f"{'':<7}", end="")
+        row = [_row_label("")]
         for i in self.get_active_labels(DataSet.Categories.TIME_OF_DAY):
-            print(f"{i:>8}", end="")
-        print()
-        for j in self.get_active_labels(DataSet.Categories.ZIP_CODE):
-            print(f"{j:<7}", end="")
-            for k in self.get_active_labels(DataSet.Categories.TIME_OF_DAY):
-                try:
-                    statistics = self._cross_table_statistics(j, k)
-                    print(f"{statistics[stat.value]:>8.2f}", end="")
-                except NoMatchingItems:
-                    print(f"{'N/A':>8}", end="")
-            print()
+            row.append(_column_label(i))
+        print("".join(row))
+        for j, cell_row in zip(
+                self.get_active_labels(DataSet.Categories.ZIP_CODE),
+                cells.tolist()):
+            print(_row_label(j) + "".join(cell_row))
 
     def _table_statistics(self, row_category: Categories, label: str):
         """ Given a category and a label, calculate summary statistics
@@ -182,24 +552,30 @@ class DataSet:
             alternate_category = DataSet.Categories.TIME_OF_DAY
         else:
             alternate_category = DataSet.Categories.ZIP_CODE
-        active_labels = self.get_active_labels(alternate_category)
-        if not self._data:
+        if not self._size:
             raise EmptyDatasetError
-        concentration_list = [item[2] for item in self._data
-                              if item[row_category.value] == label and
-                              item[alternate_category.value] in active_labels]
-        if not concentration_list:
+        code = self._label_codes[row_category].get(label)
+        if code is None:
             raise NoMatchingItems
+        active = self._active_index(alternate_category)
+        if row_category.value == 0:
+            cells = (code, active)
         else:
-            average = sum(concentration_list) / len(concentration_list)
-            return min(concentration_list), average, max(concentration_list)
+            cells = (active, code)
+        counts = self._cell_counts[cells]
+        if not counts.any():
+            raise NoMatchingItems
+        else:
+            return (float(self._cell_mins[cells].min()),
+                    float(self._cell_sums[cells].sum() / counts.sum()),
+                    float(self._cell_maxs[cells].max()))
 
     def display_field_table(self, rows: Categories):
         """ Given a category, display one row for each label in that
         category with min, avg, max displayed for each row. Include
         only rows where the other_category's label is active.
         """
-        if not self._data:
+        if not self._size:
             raise EmptyDatasetError
         print()
         print("The following data are from sensors matching these criteria:")
@@ -212,13 +588,13 @@ class DataSet:
             print(f"- {label}")
         print(f"{'':8}{'Minimum':8}{'Average':8}{'Maximum':8}")
         for item in self.get_active_labels(rows):
-            print(f"{item:7}", end="")
+            row = [_row_label(item)]
             try:
                 for statistic in self._table_statistics(rows, item):
-                    print(f"{statistic:8.2f}", end="")
+                    row.append(_number_cell(statistic))
             except NoMatchingItems:
-                print(f"{'N/A':>8}{'N/A':>8}{'N/A':>8}", end="")
-            print()
+                row.append(_missing_cell * 3)
+            print("".join(row))
 
 
 def print_menu():
@@ -231,8 +607,9 @@ def print_menu():
 def menu(my_dataset: DataSet):
     """ Print the main menu, and obtain the user's menu choice.
     Convert the user's input into an integer, and handle an exception
-    for a non-numeric input. Exit menu loop with integer 9. Print
-    the user's menu choice. Execute the user's menu choice.
+    for a non-numeric input. Exit menu loop with integer 9 and load
+    data with integer 8. Execute other menu choices through
+    menu_actions.
     """
     while True:
         print()
@@ -246,38 +623,17 @@ def menu(my_dataset: DataSet):
         if user_choice == 9:
             print("Goodbye! Thank you for looking at the menu.")
             break
-        elif user_choice == 1:
-            try:
-                my_dataset.display_cross_table(DataSet.Stats.AVG)
-            except EmptyDatasetError:
-                print("Please load a dataset first.")
-        elif user_choice == 2:
-            try:
-                my_dataset.display_cross_table(DataSet.Stats.MIN)
-            except EmptyDatasetError:
-                print("Please load a dataset first.")
-        elif user_choice == 3:
-            try:
-                my_dataset.display_cross_table(DataSet.Stats.MAX)
-            except EmptyDatasetError:
-                print("Please load a dataset first.")
-        elif user_choice == 4:
+        elif user_choice == 8:
             try:
-                my_dataset.display_field_table(DataSet.Categories.ZIP_CODE)
+                my_dataset.load_file()
             except EmptyDatasetError:
-                print("Please load a dataset first.")
-        elif user_choice == 5:
+                print("The data file contains no rows.")
+        elif user_choice in menu_actions:
+            action, args = menu_actions[user_choice]
             try:
-                my_dataset.display_field_table(
-                    DataSet.Categories.TIME_OF_DAY)
+                action(my_dataset, *args)
             except EmptyDatasetError:
                 print("Please load a dataset first.")
-        elif user_choice == 6:
-            manage_filters(my_dataset, DataSet.Categories.ZIP_CODE)
-        elif user_choice == 7:
-            manage_filters(my_dataset, DataSet.Categories.TIME_OF_DAY)
-        elif user_choice == 8:
-            my_dataset.load_file()
         else:
             print("Sorry, your choice is not on the menu.")
 
@@ -315,6 +671,17 @@ def manage_filters(dataset: DataSet, category: DataSet.Categories):
             print("Please enter a number from the list.")
 
 
+menu_actions = {
+    1: (DataSet.display_cross_table, (DataSet.Stats.AVG,)),
+    2: (DataSet.display_cross_table, (DataSet.Stats.MIN,)),
+    3: (DataSet.display_cross_table, (DataSet.Stats.MAX,)),
+    4: (DataSet.display_field_table, (DataSet.Categories.ZIP_CODE,)),
+    5: (DataSet.display_field_table, (DataSet.Categories.TIME_OF_DAY,)),
+    6: (manage_filters, (DataSet.Categories.ZIP_CODE,)),
+    7: (manage_filters, (DataSet.Categories.TIME_OF_DAY,))
+}
+
+
 def main():
     """ Obtain the user's name and print the menu.
     """
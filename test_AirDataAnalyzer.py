@@ -0,0 +1,324 @@
+""" Tests for the Air Data Analyzer: the statistics and tables of
+DataSet, and that every CSV backend and aggregation path produce the
+same results.
+"""
+
+import contextlib
+import importlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import AirDataAnalyzer
+
+HEADER = ("Identifier,Approximate Zip Code,Reading Timestamp,Reading Day,"
+          "Reading Time String,Concentration\n")
+
+ROWS = ("Sensor 1,94028,12/11/21 18:59:23,Saturday,Evening,2.23\n"
+        "Sensor 1,94028,12/12/21 00:59:27,Sunday,Night,1.16\n"
+        "Sensor 2,94304,12/12/21 06:59:31,Sunday,Morning,2.0\n"
+        "Sensor 2,94304,12/12/21 12:59:34,Sunday,Evening,0.55\n"
+        "Sensor 3,01234,12/12/21 18:59:38,Sunday,Night,3.5\n"
+        "Sensor 1,94028,12/13/21 18:59:42,Monday,Evening,4.01\n")
+
+ZIP_CODE = AirDataAnalyzer.DataSet.Categories.ZIP_CODE
+TIME_OF_DAY = AirDataAnalyzer.DataSet.Categories.TIME_OF_DAY
+
+BACKENDS = {
+    'pyarrow': (),
+    'pandas': ('pyarrow', 'pyarrow.compute', 'pyarrow.csv'),
+    'csv': ('pyarrow', 'pyarrow.compute', 'pyarrow.csv', 'pandas'),
+}
+
+
+def load_module(hidden):
+    """ Import a fresh copy of AirDataAnalyzer with the modules in
+    hidden made unimportable.
+    """
+    with mock.patch.dict(sys.modules, {name: None for name in hidden}):
+        sys.modules.pop('AirDataAnalyzer', None)
+        return importlib.import_module('AirDataAnalyzer')
+
+
+def available_backends():
+    """ Return the backends whose libraries are installed. """
+    backends = ['csv']
+    for backend, module in (('pandas', 'pandas'), ('pyarrow', 'pyarrow')):
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+        backends.append(backend)
+    return backends
+
+
+class TestReadColumns(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'air_data.csv')
+        with open(self.path, 'w', newline='') as air_file:
+            air_file.write(HEADER + ROWS)
+        self.empty_path = os.path.join(self.directory.name, 'empty.csv')
+        with open(self.empty_path, 'w', newline='') as air_file:
+            air_file.write(HEADER)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_backends_agree(self):
+        expected = load_module(BACKENDS['csv'])._read_columns(self.path)
+        self.assertEqual(expected[3], ['94028', '94304', '01234'])
+        self.assertEqual(expected[4], ['Evening', 'Night', 'Morning'])
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                result = load_module(BACKENDS[backend])._read_columns(
+                    self.path)
+                for got, want in zip(result[:3], expected[:3]):
+                    np.testing.assert_array_equal(got, want)
+                self.assertEqual(result[3:], expected[3:])
+
+    def test_header_only_file_is_empty(self):
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                result = load_module(BACKENDS[backend])._read_columns(
+                    self.empty_path)
+                for column in result:
+                    self.assertEqual(len(column), 0)
+
+    def test_aggregate_paths_agree(self):
+        if AirDataAnalyzer._numba_kernel() is None:
+            self.skipTest("numba is not installed")
+        zips = np.array([0, 0, 1, 1, 2, 0], dtype=np.int16)
+        times = np.array([0, 1, 2, 0, 1, 0], dtype=np.int16)
+        conc = np.array([2.23, 1.16, 2.0, 0.55, 3.5, 4.0])
+        numpy_result = load_module(('numba',))._aggregate(
+            zips, times, conc, 3, 3)
+        with mock.patch.multiple(AirDataAnalyzer, numba_min_rows=0,
+                                 numba_rows_per_chunk=2):
+            numba_result = AirDataAnalyzer._aggregate(
+                zips, times, conc, 3, 3)
+        for got, want in zip(numba_result, numpy_result):
+            np.testing.assert_allclose(got, want)
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'air_data.csv')
+        with open(self.path, 'w', newline='') as air_file:
+            air_file.write(HEADER + ROWS)
+        self.cache_path = AirDataAnalyzer._cache_path(self.path)
+        patcher = mock.patch.object(AirDataAnalyzer, 'filename', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def load(self):
+        dataset = AirDataAnalyzer.DataSet()
+        with mock.patch('builtins.print'):
+            dataset.load_file()
+        return dataset
+
+    def test_damaged_cache_is_replaced(self):
+        expected = self.load()
+        source = os.stat(self.path)
+        for damage in (b'PK\x03\x04garbage', b''):
+            with self.subTest(damage=damage):
+                with open(self.cache_path, 'wb') as cache_file:
+                    cache_file.write(damage)
+                dataset = self.load()
+                np.testing.assert_array_equal(dataset._conc,
+                                              expected._conc)
+                self.assertTrue(
+                    AirDataAnalyzer.DataSet()._read_cache(source))
+        self.assertEqual(sorted(os.listdir(self.directory.name)),
+                         ['air_data.csv', 'air_data.npz'])
+
+    def test_header_only_file_is_not_cached(self):
+        with open(self.path, 'w', newline='') as air_file:
+            air_file.write(HEADER)
+        for _ in range(2):
+            with self.assertRaises(AirDataAnalyzer.EmptyDatasetError):
+                self.load()
+            self.assertFalse(os.path.exists(self.cache_path))
+
+
+class TestDataSet(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(self.directory.name, 'air_data.csv')
+        with open(path, 'w', newline='') as air_file:
+            air_file.write(HEADER + ROWS)
+        patcher = mock.patch.object(AirDataAnalyzer, 'filename', path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.dataset = AirDataAnalyzer.DataSet()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.dataset.load_file()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertStatistics(self, statistics, expected):
+        self.assertEqual(len(statistics), 3)
+        for got, want in zip(statistics, expected):
+            self.assertAlmostEqual(got, want)
+
+    def render(self, display, *args):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            display(*args)
+        return output.getvalue()
+
+    def test_empty_dataset_raises(self):
+        dataset = AirDataAnalyzer.DataSet()
+        with self.assertRaises(AirDataAnalyzer.EmptyDatasetError):
+            dataset.get_active_labels(ZIP_CODE)
+        with self.assertRaises(AirDataAnalyzer.EmptyDatasetError):
+            dataset.display_cross_table(dataset.Stats.AVG)
+        with self.assertRaises(AirDataAnalyzer.EmptyDatasetError):
+            dataset.display_field_table(ZIP_CODE)
+
+    def test_labels_keep_file_order(self):
+        self.assertEqual(self.dataset.get_labels(ZIP_CODE),
+                         ['94028', '94304', '01234'])
+        self.assertEqual(self.dataset.get_labels(TIME_OF_DAY),
+                         ['Evening', 'Night', 'Morning'])
+
+    def test_cross_table_statistics(self):
+        expected = {('94028', 'Evening'): (2.23, 3.12, 4.01),
+                    ('94028', 'Night'): (1.16, 1.16, 1.16),
+                    ('94304', 'Evening'): (0.55, 0.55, 0.55),
+                    ('94304', 'Morning'): (2.0, 2.0, 2.0),
+                    ('01234', 'Night'): (3.5, 3.5, 3.5)}
+        for zip_code in self.dataset.get_labels(ZIP_CODE):
+            for time in self.dataset.get_labels(TIME_OF_DAY):
+                with self.subTest(zip_code=zip_code, time=time):
+                    if (zip_code, time) in expected:
+                        self.assertStatistics(
+                            self.dataset._cross_table_statistics(
+                                zip_code, time),
+                            expected[(zip_code, time)])
+                    else:
+                        with self.assertRaises(
+                                AirDataAnalyzer.NoMatchingItems):
+                            self.dataset._cross_table_statistics(
+                                zip_code, time)
+        with self.assertRaises(AirDataAnalyzer.NoMatchingItems):
+            self.dataset._cross_table_statistics('99999', 'Evening')
+
+    def test_table_statistics(self):
+        expected = {(ZIP_CODE, '94028'): (1.16, 7.40 / 3, 4.01),
+                    (ZIP_CODE, '94304'): (0.55, 1.275, 2.0),
+                    (ZIP_CODE, '01234'): (3.5, 3.5, 3.5),
+                    (TIME_OF_DAY, 'Evening'): (0.55, 6.79 / 3, 4.01),
+                    (TIME_OF_DAY, 'Night'): (1.16, 2.33, 3.5),
+                    (TIME_OF_DAY, 'Morning'): (2.0, 2.0, 2.0)}
+        for (category, label), statistics in expected.items():
+            with self.subTest(label=label):
+                self.assertStatistics(
+                    self.dataset._table_statistics(category, label),
+                    statistics)
+
+    def test_table_statistics_with_inactive_labels(self):
+        self.dataset.toggle_active_label(ZIP_CODE, '94028')
+        self.dataset.toggle_active_label(TIME_OF_DAY, 'Night')
+        self.assertStatistics(
+            self.dataset._table_statistics(ZIP_CODE, '94304'),
+            (0.55, 1.275, 2.0))
+        with self.assertRaises(AirDataAnalyzer.NoMatchingItems):
+            self.dataset._table_statistics(ZIP_CODE, '01234')
+        self.assertStatistics(
+            self.dataset._table_statistics(TIME_OF_DAY, 'Evening'),
+            (0.55, 0.55, 0.55))
+        self.assertStatistics(
+            self.dataset._table_statistics(TIME_OF_DAY, 'Morning'),
+            (2.0, 2.0, 2.0))
+
+    def test_toggle_updates_active_labels(self):
+        self.assertEqual(self.dataset.get_active_labels(ZIP_CODE),
+                         ('94028', '94304', '01234'))
+        self.dataset.toggle_active_label(ZIP_CODE, '94304')
+        self.assertEqual(self.dataset.get_active_labels(ZIP_CODE),
+                         ('94028', '01234'))
+        self.dataset.toggle_active_label(ZIP_CODE, '94304')
+        self.assertEqual(self.dataset.get_active_labels(ZIP_CODE),
+                         ('94028', '94304', '01234'))
+        self.assertEqual(self.dataset.get_active_labels(TIME_OF_DAY),
+                         ('Evening', 'Night', 'Morning'))
+        with self.assertRaises(KeyError):
+            self.dataset.toggle_active_label(ZIP_CODE, '99999')
+
+    def test_display_cross_table(self):
+        self.assertEqual(
+            self.render(self.dataset.display_cross_table,
+                        self.dataset.Stats.AVG),
+            "\n"
+            "        Evening   Night Morning\n"
+            "94028      3.12    1.16     N/A\n"
+            "94304      0.55     N/A    2.00\n"
+            "01234       N/A    3.50     N/A\n")
+
+    def test_display_cross_table_with_inactive_labels(self):
+        self.dataset.toggle_active_label(ZIP_CODE, '94028')
+        self.dataset.toggle_active_label(TIME_OF_DAY, 'Night')
+        self.assertEqual(
+            self.render(self.dataset.display_cross_table,
+                        self.dataset.Stats.MAX),
+            "\n"
+            "        Evening Morning\n"
+            "94304      0.55    2.00\n"
+            "01234       N/A     N/A\n")
+
+    def test_display_field_table_with_inactive_labels(self):
+        self.dataset.toggle_active_label(ZIP_CODE, '94028')
+        self.assertEqual(
+            self.render(self.dataset.display_field_table, TIME_OF_DAY),
+            "\n"
+            "The following data are from sensors matching these criteria:\n"
+            "\n"
+            "- 94304\n"
+            "- 01234\n"
+            "        Minimum Average Maximum \n"
+            "Evening    0.55    0.55    0.55\n"
+            "Night      3.50    3.50    3.50\n"
+            "Morning    2.00    2.00    2.00\n")
+
+    def test_all_inactive_category(self):
+        for time in self.dataset.get_labels(TIME_OF_DAY):
+            self.dataset.toggle_active_label(TIME_OF_DAY, time)
+        self.assertEqual(self.dataset.get_active_labels(TIME_OF_DAY), ())
+        for zip_code in self.dataset.get_labels(ZIP_CODE):
+            with self.assertRaises(AirDataAnalyzer.NoMatchingItems):
+                self.dataset._table_statistics(ZIP_CODE, zip_code)
+        self.assertEqual(
+            self.render(self.dataset.display_cross_table,
+                        self.dataset.Stats.MIN),
+            "\n"
+            "       \n"
+            "94028  \n"
+            "94304  \n"
+            "01234  \n")
+        self.assertEqual(
+            self.render(self.dataset.display_field_table, ZIP_CODE),
+            "\n"
+            "The following data are from sensors matching these criteria:\n"
+            "\n"
+            "        Minimum Average Maximum \n"
+            "94028       N/A     N/A     N/A\n"
+            "94304       N/A     N/A     N/A\n"
+            "01234       N/A     N/A     N/A\n")
+
+
+if __name__ == '__main__':
+    unittest.main()